@@ -1,30 +1,62 @@
 """Lobotomy library used for mocking boto session/client behaviors for testing."""
-import pathlib as _pathlib
-from importlib import metadata as _metadata
-
-import toml as _toml
-
-from ._cli import run as run_cli  # noqa: F401
-from ._clients import Client  # noqa: F401
-from ._exceptions import ClientError  # noqa: F401
-from ._exceptions import DataTypeError  # noqa: F401
-from ._exceptions import NoResponseFound  # noqa: F401
-from ._exceptions import NoSuchMethod  # noqa: F401
-from ._exceptions import RequestValidationError  # noqa: F401
-from ._mocking import Patch  # noqa: F401
-from ._mocking import patch  # noqa: F401
-from ._sessions import Lobotomy  # noqa: F401
-from ._sessions import ServiceCall  # noqa: F401
-from ._sessions import Session  # noqa: F401
-from ._yaml import InjectString  # noqa: F401
-from ._yaml import ToJson  # noqa: F401
-from ._yaml import YamlModifier  # noqa: F401
-
-try:
-    __version__ = _metadata.version(__package__)
-except _metadata.PackageNotFoundError:  # pragma: no cover
-    # If the package is not installed such that it has distribution metadata
-    # fallback to loading the version from the pyproject.toml file.
-    __version__ = _toml.loads(
-        _pathlib.Path(__file__).parent.parent.joinpath("pyproject.toml").read_text()
-    )["tool"]["poetry"]["version"]
+import importlib as _importlib
+import typing as _typing
+
+from ._version import __version__  # noqa: F401
+
+if _typing.TYPE_CHECKING:  # pragma: no cover
+    from ._cli import run as run_cli  # noqa: F401
+    from ._clients import Client  # noqa: F401
+    from ._exceptions import ClientError  # noqa: F401
+    from ._exceptions import DataTypeError  # noqa: F401
+    from ._exceptions import NoResponseFound  # noqa: F401
+    from ._exceptions import NoSuchMethod  # noqa: F401
+    from ._exceptions import RequestValidationError  # noqa: F401
+    from ._mocking import Patch  # noqa: F401
+    from ._mocking import patch  # noqa: F401
+    from ._sessions import Lobotomy  # noqa: F401
+    from ._sessions import ServiceCall  # noqa: F401
+    from ._sessions import Session  # noqa: F401
+    from ._yaml import InjectString  # noqa: F401
+    from ._yaml import ToJson  # noqa: F401
+    from ._yaml import YamlModifier  # noqa: F401
+
+#: Public members of the package mapped to the module and attribute names where
+#: they are defined. These are imported on first access instead of at package
+#: import time so that the CLI and other light consumers don't have to pay for
+#: importing botocore, yaml and friends until they are actually needed.
+_LAZY_MEMBERS: _typing.Dict[str, _typing.Tuple[str, str]] = {
+    "run_cli": ("._cli", "run"),
+    "Client": ("._clients", "Client"),
+    "ClientError": ("._exceptions", "ClientError"),
+    "DataTypeError": ("._exceptions", "DataTypeError"),
+    "NoResponseFound": ("._exceptions", "NoResponseFound"),
+    "NoSuchMethod": ("._exceptions", "NoSuchMethod"),
+    "RequestValidationError": ("._exceptions", "RequestValidationError"),
+    "Patch": ("._mocking", "Patch"),
+    "patch": ("._mocking", "patch"),
+    "Lobotomy": ("._sessions", "Lobotomy"),
+    "ServiceCall": ("._sessions", "ServiceCall"),
+    "Session": ("._sessions", "Session"),
+    "InjectString": ("._yaml", "InjectString"),
+    "ToJson": ("._yaml", "ToJson"),
+    "YamlModifier": ("._yaml", "YamlModifier"),
+}
+
+__all__ = ["__version__", *_LAZY_MEMBERS]
+
+
+def __getattr__(name: str) -> _typing.Any:
+    """Import the public member of the package on first access and cache it."""
+    if name not in _LAZY_MEMBERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute_name = _LAZY_MEMBERS[name]
+    value = getattr(_importlib.import_module(module_name, __name__), attribute_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> _typing.List[str]:
+    """List the package attributes, including those not yet lazily imported."""
+    return sorted({*globals(), *_LAZY_MEMBERS})
@@ -2,9 +2,6 @@ import json
 import pathlib
 import typing
 
-import toml
-import yaml
-
 from lobotomy import _fio
 from lobotomy import _mutator
 from lobotomy import _services
@@ -14,10 +11,11 @@ from lobotomy._cli import _definitions
 def _get_path(
     context: "_definitions.CliContext",
 ) -> typing.Optional[pathlib.Path]:
-    if context.args.configuration_file_path in [None, "-"]:
+    path = context.args.configuration_file_path
+    if path is None or path == "-":
         return None
 
-    return pathlib.Path(context.args.configuration_file_path).expanduser().absolute()
+    return pathlib.Path(path).expanduser().absolute()
 
 
 def run(context: "_definitions.CliContext") -> "_definitions.ExecutionResult":
@@ -46,8 +44,12 @@ def run(context: "_definitions.CliContext") -> "_definitions.ExecutionResult":
     if file_format == "json":
         print(json.dumps(configs, indent=2))
     elif file_format == "toml":
+        import toml
+
         print(toml.dumps(configs))
     else:
+        import yaml
+
         print(yaml.dump(configs))
 
     return _definitions.ExecutionResult(
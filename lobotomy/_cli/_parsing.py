@@ -1,9 +1,26 @@
 import argparse
+import functools
+import sys
 import typing
 
+_FILE_FORMATS = ("yaml", "toml", "json")
 
-def parse(arguments: typing.List[str] = None) -> argparse.Namespace:
-    """Parse command line arguments for command execution."""
+#: Option flags for the add command mapped to their destination names.
+_ADD_OPTIONS = {
+    "--format": "file_format",
+    "--file-format": "file_format",
+    "--prefix": "prefix",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _create_parser() -> argparse.ArgumentParser:
+    """
+    Create the full argparse parser for the command line interface.
+
+    The parser is cached for reuse when the CLI is run repeatedly within the
+    same process, e.g. from tests.
+    """
     parser = argparse.ArgumentParser(
         prog="lobotomy",
         description="""
@@ -20,8 +37,81 @@ def parse(arguments: typing.List[str] = None) -> argparse.Namespace:
         "--format",
         "--file-format",
         dest="file_format",
-        choices=["yaml", "toml", "json"],
+        choices=_FILE_FORMATS,
     )
     add_parser.add_argument("--prefix")
 
-    return parser.parse_args(args=arguments)
+    return parser
+
+
+def _parse_add_option(
+    argument: str,
+    remaining: typing.Iterator[str],
+) -> typing.Optional[typing.Tuple[str, str]]:
+    """
+    Parse an option flag of the add command and its value.
+
+    The value is taken from the remaining arguments when it isn't given in the
+    "--flag=value" form. None is returned for unknown flags, missing values and
+    invalid formats so that argparse can handle them instead.
+    """
+    flag, separator, value = argument.partition("=")
+    if flag not in _ADD_OPTIONS:
+        return None
+    if not separator:
+        value = next(remaining, "-")
+        if value.startswith("-"):
+            return None
+
+    destination = _ADD_OPTIONS[flag]
+    if destination == "file_format" and value not in _FILE_FORMATS:
+        return None
+    return destination, value
+
+
+def _parse_add(arguments: typing.List[str]) -> typing.Optional[argparse.Namespace]:
+    """
+    Parse the arguments for the add command without creating the argparse parser.
+
+    This only handles the simple, valid forms of the command. None is returned for
+    anything else, e.g. help flags or invalid formats, so that argparse can handle
+    those cases and report errors in the usual way.
+    """
+    positionals: typing.List[str] = []
+    options: typing.Dict[str, typing.Optional[str]] = {
+        "file_format": None,
+        "prefix": None,
+    }
+
+    remaining = iter(arguments[1:])
+    for argument in remaining:
+        if argument.startswith("--"):
+            option = _parse_add_option(argument, remaining)
+            if option is None:
+                return None
+            options[option[0]] = option[1]
+        elif argument.startswith("-") and argument != "-":
+            return None
+        else:
+            positionals.append(argument)
+
+    if len(positionals) != 2:
+        return None
+
+    return argparse.Namespace(
+        command="add",
+        boto_operation=positionals[0],
+        configuration_file_path=positionals[1],
+        **options,
+    )
+
+
+def parse(arguments: typing.List[str] = None) -> argparse.Namespace:
+    """Parse command line arguments for command execution."""
+    args = sys.argv[1:] if arguments is None else arguments
+    if args and args[0] == "add":
+        parsed = _parse_add(args)
+        if parsed is not None:
+            return parsed
+
+    return _create_parser().parse_args(args=args)
@@ -10,6 +10,101 @@ import lobotomy
 from lobotomy import _services
 from lobotomy._clients import _casting
 from lobotomy._clients import _validation
+from lobotomy._exceptions import ClientError
+from lobotomy._sessions import ServiceCall
+
+_PRESIGNED_URL_TEMPLATE = (
+    "https://{name}.amazonaws.com/"
+    "?Action={action}"
+    "&Version={version}"
+    "&X-Amz-Algorithm=AWS4-HMAC-SHA256"
+    "&X-Amz-Credential={access}%2F{day}%2F{region}%2F{name}%2Faws4_request"
+    "&X-Amz-Date={date}"
+    "&X-Amz-Expires={expires}"
+    "&X-Amz-SignedHeaders=host"
+    "&X-Amz-Security-Token=LobotomyFakeToken"
+    "&X-Amz-Signature=lobotomyfakesignature"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _to_action_name(method_name: str) -> str:
+    """Convert a snake_case client method name into its PascalCase action name."""
+    return "".join([w.capitalize() for w in method_name.split("_")])
+
+
+@functools.lru_cache(maxsize=None)
+def _get_exception_types(
+    service_name: str,
+) -> typing.Dict[str, typing.Type["lobotomy.ClientError"]]:
+    """
+    Create the client error types for the exceptions defined by the service.
+
+    These are cached per service, as is the case for botocore clients, so that
+    the types are only created once and are shared among all clients of the
+    service.
+    """
+    service = _services.load_definition(service_name)
+    return {
+        name: type(name, (lobotomy.ClientError,), {}) for name in service.exceptions
+    }
+
+
+class ClientExceptions:
+    """
+    Mock the exceptions object of boto3 clients.
+
+    The error types defined by the service are resolved as attributes of this
+    object in the same way they are on the exceptions object of boto3 clients.
+    """
+
+    def __init__(
+        self,
+        error_types: typing.Dict[str, typing.Type["lobotomy.ClientError"]],
+    ):
+        """Store the error types defined for the service by their error codes."""
+        self._error_types = error_types
+
+    @property
+    def ClientError(self) -> typing.Type["lobotomy.ClientError"]:
+        """Fetch the base error type for all service errors."""
+        return lobotomy.ClientError
+
+    def from_code(self, error_code: str) -> typing.Type["lobotomy.ClientError"]:
+        """Fetch the error type for the error code or the base type if not found."""
+        return self._error_types.get(error_code, lobotomy.ClientError)
+
+    def __getattr__(self, item: str) -> typing.Type["lobotomy.ClientError"]:
+        """Fetch the error type for the error code specified as an attribute."""
+        # Error codes never start with an underscore. Those attributes are probes
+        # made before the error types are set, e.g. by copy, and must not recurse.
+        if item.startswith("_"):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {item!r}"
+            )
+
+        try:
+            return self._error_types[item]
+        except KeyError:
+            raise AttributeError(f"Service has no error type named {item}") from None
+
+
+class Paginator:
+    """
+    Mock the paginators of boto3 clients.
+
+    Paginating returns a single page containing the response of the client method.
+    """
+
+    __slots__ = ("_caller",)
+
+    def __init__(self, caller: typing.Callable[..., typing.Any]):
+        """Store the caller of the client method being paginated."""
+        self._caller = caller
+
+    def paginate(self, *args, **kwargs) -> typing.List[typing.Any]:
+        """Call the client method and return its response as the only page."""
+        return [self._caller(*args, **kwargs)]
 
 
 class Client:
@@ -19,6 +114,18 @@ class Client:
     This pulls response data from data stored in configuration files.
     """
 
+    # A __dict__ is kept for the lazily created meta and the method callers that
+    # are cached on the instance as they are accessed.
+    __slots__ = (
+        "_service_name",
+        "_client_init_kwargs",
+        "_service",
+        "_session",
+        "_registered_exceptions",
+        "exceptions",
+        "__dict__",
+    )
+
     def __init__(
         self,
         session: "lobotomy.Session",
@@ -46,55 +153,73 @@ class Client:
             "aws_session_token": aws_session_token,
             "config": config,
         }
-        self._calls: typing.List[lobotomy.ServiceCall] = []
         self._service: _services.Service = _services.load_definition(
             service_name,
         )
         self._session = session
 
-        self.meta = ClientMeta(
+        self._registered_exceptions = _get_exception_types(service_name)
+        self.exceptions = ClientExceptions(self._registered_exceptions)
+
+    @functools.cached_property
+    def meta(self) -> ClientMeta:
+        """
+        Mock the metadata of the client.
+
+        This is created on first access as most uses of the client never need it.
+        """
+        return ClientMeta(
             events=MagicMock(),
-            client_config=config,
-            endpoint_url=endpoint_url,
+            client_config=self._client_init_kwargs["config"],
+            endpoint_url=self._client_init_kwargs["endpoint_url"],
             service_model=MagicMock(),
             method_to_api_mapping={},
             partition="aws",
         )
-        self.exceptions = MagicMock()
-        self._registered_exceptions = {}
-        for name in self._service.exceptions:
-            new_type = type(name, (lobotomy.ClientError,), {})
-            setattr(self.exceptions, name, new_type)
-            self._registered_exceptions[name] = new_type
-
-    def _call(self, called_method_name: str, *args, **kwargs):
-        raw = self._session.lobotomy.pop_response(
+
+    @property
+    def _calls(self) -> typing.List["lobotomy.ServiceCall"]:
+        """
+        Fetch the service calls that have been made for the service of this client.
+
+        These are derived from the calls recorded by the lobotomy instance instead
+        of being tracked separately for each client.
+        """
+        return [
+            c
+            for c in self._session.lobotomy.service_calls
+            if c.service == self._service_name
+        ]
+
+    def _call(self, method: "_services.Method", *args, **kwargs):
+        source = self._session.lobotomy
+        raw = source.pop_response(
             self._service_name,
-            called_method_name,
+            method.name,
             arguments={"args": args, "kwargs": kwargs},
         )
-        method = self._service.lookup(called_method_name)
         request = _validation.validate_input(method, args, kwargs)
         response = _casting.cast(method.output, raw)
 
-        service_call = lobotomy.ServiceCall(
-            service=self._service_name,
-            method=called_method_name,
-            request=request,
-            args=args,
-            kwargs=kwargs,
-            response=response,
+        # Arguments are in field order: service, method, request, args, kwargs
+        # and response.
+        service_call = ServiceCall(
+            self._service_name,
+            method.name,
+            request,
+            args,
+            kwargs,
+            response,
         )
-
-        self._session.lobotomy.record_call(service_call)
-        self._calls.append(service_call)
+        source.record_call(service_call)
 
         if "Error" in response:
-            error = self._registered_exceptions.get(
-                response["Error"]["Code"],
-                lobotomy.ClientError,
-            )()
-            raise error.populate(**response["Error"])
+            error_data = response["Error"]
+            error_type = self._registered_exceptions.get(
+                error_data["Code"],
+                ClientError,
+            )
+            raise error_type().populate(**error_data)
         return response
 
     def __getattr__(self, item: str):
@@ -103,7 +228,16 @@ class Client:
 
         This comes from the scenario data that defines the execution.
         """
-        if not self._service.has(item):
+        # Client methods never start with an underscore. Those attributes are
+        # usually probes from introspection, e.g. copy or mock looking for
+        # __wrapped__, which should fail in the usual way for missing attributes.
+        if item.startswith("_"):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {item!r}"
+            )
+
+        method = self._service.find(item)
+        if method is None:
             raise lobotomy.NoSuchMethod(
                 f"""
                 No boto/botocore definition found for "{self._service_name}{item}()".
@@ -113,7 +247,12 @@ class Client:
                 """
             )
 
-        return functools.partial(self._call, item)
+        # The caller is stored on the instance so that subsequent accesses of the
+        # method resolve as a normal attribute without calling __getattr__ again.
+        # A partial is used over a closure as calling it is considerably faster.
+        caller = functools.partial(self._call, method)
+        setattr(self, item, caller)
+        return caller
 
     def generate_presigned_url(
         self,
@@ -139,42 +278,28 @@ class Client:
             is whatever is used in the method's model.
         """
         name = self._service_name
-        action = "".join([w.capitalize() for w in ClientMethod.split("_")])
+        action = _to_action_name(ClientMethod)
         version = self._client_init_kwargs["api_version"] or "2011-06-15"
         access = (
             self._client_init_kwargs["aws_access_key_id"]
             or self._session.get_credentials().access_key
         )
         region = self._client_init_kwargs["region_name"] or self._session.region_name
-        now = (
-            datetime.datetime.utcnow()
-            .replace(microsecond=0)
-            .astimezone(datetime.timezone.utc)
-        )
-        day = now.date().isoformat().replace("-", "")
-        date = (
-            now.isoformat("T").replace("+00:00", "Z").replace(":", "").replace("-", "")
+        now = datetime.datetime.now(datetime.timezone.utc)
+        day = now.strftime("%Y%m%d")
+        date = now.strftime("%Y%m%dT%H%M%SZ")
+        return _PRESIGNED_URL_TEMPLATE.format(
+            name=name,
+            action=action,
+            version=version,
+            access=access,
+            day=day,
+            region=region,
+            date=date,
+            expires=ExpiresIn,
         )
-        url_parts = [
-            f"https://{name}.amazonaws.com/",
-            f"?Action={action}",
-            f"&Version={version}",
-            "&X-Amz-Algorithm=AWS4-HMAC-SHA256",
-            f"&X-Amz-Credential={access}%2F{day}%2F{region}%2F{name}%2Faws4_request",
-            f"&X-Amz-Date={date}",
-            f"&X-Amz-Expires={ExpiresIn}",
-            "&X-Amz-SignedHeaders=host",
-            "&X-Amz-Security-Token=LobotomyFakeToken",
-            "&X-Amz-Signature=lobotomyfakesignature",
-        ]
-        return "".join(url_parts)
 
-    def get_paginator(self, item: str) -> MagicMock:
+    def get_paginator(self, item: str) -> Paginator:
         """Mock a single-page paginator response."""
-
-        def _call(*args, **kwargs):
-            return [self._call(item, *args, **kwargs)]
-
-        paginator = MagicMock()
-        paginator.paginate.side_effect = _call
-        return paginator
+        method = self._service.lookup(item)
+        return Paginator(functools.partial(self._call, method))
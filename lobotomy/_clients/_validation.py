@@ -29,28 +29,28 @@ def validate_input(
         A dictionary containing the normalized request that combines args and kwargs
         into a single request kwargs dictionary.
     """
-    definition = method.input
-    keys = list(definition["members"].keys())
+    keys = method.input_keys
     request = {
         **{keys[i]: a for i, a in enumerate(request_args)},
         **(request_kwargs or {}),
     }
 
     specified_keys = request.keys()
-    required = set(definition.get("required", []))
 
-    if required > set(specified_keys):
+    missing_keys = method.required_input_keys - specified_keys
+    if missing_keys:
         raise lobotomy.RequestValidationError(
             f"""
-            Missing required arguments {required - set(specified_keys)}
+            Missing required arguments {missing_keys}
             on {method.service.name}.{method.name}.
             """
         )
 
-    unknown_keys = set(
-        [k for k in (set(specified_keys) - set(keys)) if not k.startswith("_")]
-    )
-    if unknown_keys:
+    # Arguments starting with an underscore are ignored. The set of unknown keys
+    # is only assembled when there are extra arguments that aren't ignored.
+    extra_keys = specified_keys - method.input_key_set
+    if extra_keys and not all(k.startswith("_") for k in extra_keys):
+        unknown_keys = {k for k in extra_keys if not k.startswith("_")}
         raise lobotomy.RequestValidationError(
             f"""
             Unknown arguments {unknown_keys} found on call to
@@ -52,8 +52,13 @@ class ClientError(Exception):
         """Serialize boto response format for the object."""
         return {"Error": {"Code": self._code, "Message": self._message}}
 
-    def populate(self, **kwargs) -> "ClientError":
+    def populate(
+        self,
+        Code: typing.Optional[str] = None,
+        Message: typing.Optional[str] = None,
+        **kwargs,
+    ) -> "ClientError":
         """Specify code and message for the client error."""
-        self._code = kwargs.get("Code")
-        self._message = kwargs.get("Message")
+        self._code = Code
+        self._message = Message
         return self
@@ -1,16 +1,28 @@
+import copy
 import dataclasses
+import functools
 import json
 import pathlib
 import re
 import textwrap
 import typing
 
-import toml
-import yaml
-import yaml.constructor
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 _indent_regex = re.compile(r"^(?P<indent>\s*)")
 _path_regex = re.compile(r"!lobotomy.inject_(?P<kind>[^\s]+)\s+(?P<path>[^\s\n]+)")
+_margin_regex = re.compile(r"^ *(?=[^ \n])", re.MULTILINE)
+
+#: File formats of configuration files mapped by their file name suffixes.
+_FILE_FORMATS_BY_SUFFIX = {
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".toml": "toml",
+    ".json": "json",
+}
 
 
 @dataclasses.dataclass(frozen=True)
@@ -56,6 +68,36 @@ class YamlBlock:
         return "{}\n{}".format(self.key_line, textwrap.indent(self.body, "  "))
 
 
+def _dedent(text: str) -> str:
+    """
+    Remove the common leading whitespace from the lines of the text.
+
+    This is equivalent to textwrap.dedent, but faster for the space-indented
+    YAML blocks that are handled here. Text containing tabs is handed off to
+    textwrap.dedent to handle mixed indentation.
+    """
+    if "\t" in text:
+        return textwrap.dedent(text)
+
+    margin = min(map(len, _margin_regex.findall(text)), default=0)
+    lines = text.split("\n")
+    return "\n".join([line[margin:] if line.strip(" ") else "" for line in lines])
+
+
+@functools.lru_cache(maxsize=None)
+def _get_block_regex(key: str) -> typing.Pattern:
+    """
+    Create the regex that finds the key line and indented body of a key in a block.
+
+    The key line is the first line that starts with the key, ignoring leading
+    whitespace, and the body is every following line that is indented.
+    """
+    return re.compile(
+        rf"(?P<key_line>^[^\S\n]*{re.escape(key)}:.*$)(?P<body>(?:\n [^\n]*)*)",
+        re.MULTILINE,
+    )
+
+
 def _get_block(key: str, block: YamlBlock) -> YamlBlock:
     """
     Retrieve the block within the specified argument block's body for the specified key.
@@ -73,27 +115,18 @@ def _get_block(key: str, block: YamlBlock) -> YamlBlock:
         the contents of the parent block. If the key is not found a block will be
         returned with an empty body and start/end indexes of -1.
     """
-    lines = block.body.split("\n")
-    index_finder = (
-        i for i, line in enumerate(lines) if line.strip().startswith(f"{key}:")
-    )
-    start = next(index_finder, None)
-    if start is None:
+    match = _get_block_regex(key).search(block.body)
+    if match is None:
         return YamlBlock(key, f"{key}:", "", -1, -1)
 
-    output_lines = []
-    for line in lines[(start + 1) :]:
-        if not line.startswith(" "):
-            break
-        output_lines.append(line)
-
-    offset = block.start_index + start + 1
+    body = match.group("body")
+    offset = block.start_index + block.body.count("\n", 0, match.start()) + 1
     return YamlBlock(
         key,
-        key_line=lines[start],
-        body=textwrap.dedent("\n".join(output_lines)),
+        key_line=match.group("key_line"),
+        body=_dedent(body[1:]),
         start_index=offset,
-        end_index=offset + len(output_lines),
+        end_index=offset + body.count("\n"),
     )
 
 
@@ -114,7 +147,7 @@ def _extract(
     :return:
         Clients block, sessions block, and parent lobotomy block.
     """
-    body = textwrap.dedent(contents.strip().replace("\r", ""))
+    body = _dedent(contents.strip().replace("\r", ""))
     prefix_block = YamlBlock("", "", body, 0, 1 + body.count("\n"))
     for key in prefix:
         prefix_block = _get_block(key, prefix_block)
@@ -146,6 +179,36 @@ def _get_prefix(
     return prefix.split(".") if isinstance(prefix, str) else prefix
 
 
+def _replace_path(directory: pathlib.Path, match: re.Match) -> str:
+    """Replace a lobotomy inject path with its absolute and original paths."""
+    kind = match.group("kind")
+    source = match.group("path").strip("\"'")
+    p = directory.joinpath(source).expanduser().absolute()
+    value = json.dumps({"absolute": str(p), "original": source})
+    return f"!lobotomy.inject_{kind} '{value}'"
+
+
+def _get_lobotomy_data(
+    data: typing.Optional[dict],
+    prefix: typing.Iterable[str],
+) -> dict:
+    """
+    Fetch the lobotomy data found at the prefix within the loaded file data.
+
+    An empty dictionary is returned as soon as a key in the prefix is missing
+    or empty instead of descending through empty dictionaries.
+    """
+    output = data
+    for key in prefix:
+        if not output:
+            return {}
+        output = output.get(key)
+
+    if not output:
+        return {}
+    return {k: v for k, v in output.items() if k in ("clients", "sessions")}
+
+
 def _normalize_yaml(contents: str, directory: pathlib.Path) -> str:
     """
     Normalize Yaml class configuration for advanced loading functionality.
@@ -155,17 +218,9 @@ def _normalize_yaml(contents: str, directory: pathlib.Path) -> str:
     :param directory:
         Absolute directory to the folder location for the loaded YAML file.
     """
-
-    def path_replacer(match: re.Match) -> str:
-
-        kind = match.group("kind")
-        source = match.group("path").strip("\"'")
-        p = directory.joinpath(source).expanduser().absolute()
-        value = json.dumps({"absolute": str(p), "original": source})
-        return f"!lobotomy.inject_{kind} '{value}'"
-
-    normalized = re.sub(_path_regex, path_replacer, contents)
-    return normalized
+    if "!lobotomy.inject_" not in contents:
+        return contents
+    return _path_regex.sub(functools.partial(_replace_path, directory), contents)
 
 
 def _read_yaml(
@@ -190,70 +245,129 @@ def _read_yaml(
     :return:
         Lobotomy data loaded from the YAML string by either of the methods.
     """
+    import yaml
+
+    from lobotomy import _yaml
+
     normalized = _normalize_yaml(contents, directory)
     try:
-        output = yaml.full_load(normalized)
-        for key in prefix:
-            output = output.get(key) or {}
-        return {k: v for k, v in output.items() if k in ("clients", "sessions")}
+        return _get_lobotomy_data(yaml.load(normalized, Loader=_yaml.Loader), prefix)
     except yaml.constructor.ConstructorError:
         pass
 
     clients_block, sessions_block, _ = _extract(normalized, prefix)
     data = {}
     if clients_block.start_index != -1:
-        data.update(yaml.full_load(clients_block.outer_body))
+        data.update(yaml.load(clients_block.outer_body, Loader=_yaml.Loader))
     if sessions_block.start_index != -1:
-        data.update(yaml.full_load(sessions_block.outer_body))
+        data.update(yaml.load(sessions_block.outer_body, Loader=_yaml.Loader))
     return data
 
 
+def _load_json(contents: str) -> typing.Any:
+    """
+    Load JSON contents using orjson when it is installed.
+
+    The standard library json module is used otherwise, or when orjson rejects
+    the contents, e.g. NaN values that the json module accepts, so that the
+    results and errors are the same either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(contents)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(contents)
+
+
+def _load_toml(contents: str) -> dict:
+    """
+    Load TOML contents using the standard library tomllib when it is available.
+
+    The toml package is used on Python versions before 3.11, or when tomllib
+    rejects the contents that the more lenient toml package accepts, so that the
+    results and errors are the same either way.
+    """
+    try:
+        import tomllib
+    except ImportError:  # pragma: no cover
+        pass
+    else:
+        try:
+            return tomllib.loads(contents)
+        except tomllib.TOMLDecodeError:
+            pass
+
+    import toml
+
+    return typing.cast(dict, toml.loads(contents))
+
+
 def _read_file_data(
     path: pathlib.Path,
     file_format: typing.Optional[str],
+    contents: str,
 ) -> dict:
-    """Read existing data from the source file with the given format."""
-    contents = path.read_text()
+    """Parse existing data read from the source file with the given format."""
+    format_id = _get_file_format_id(path, file_format)
+    if format_id == "yaml":
+        import yaml
 
-    if file_format == "yaml" or path.name.endswith((".yaml", ".yml")):
-        return yaml.full_load(_normalize_yaml(contents, path.parent))
+        from lobotomy import _yaml
 
-    if file_format == "toml" or path.name.endswith(".toml"):
-        return typing.cast(dict, toml.loads(contents))
+        normalized = _normalize_yaml(contents, path.parent)
+        return yaml.load(normalized, Loader=_yaml.Loader)
 
-    return json.loads(contents)
+    if format_id == "toml":
+        return _load_toml(contents)
+
+    return _load_json(contents)
 
 
 def _read_file(
     path: pathlib.Path,
     file_format: typing.Optional[str],
     prefix: typing.Iterable[str],
+    contents: str,
 ) -> dict:
     """
-    Read the configuration file from disk if it exists.
+    Load the lobotomy data from the contents read from the configuration file.
 
     :param path:
-        Location of the file to read.
+        Location of the file that was read.
     :param file_format:
         Specifies the format of the file to load. If None the extension of the
         file path will be used to determine the type of file to read.
     :param prefix:
         Key prefix within the YAML string where the lobotomy data resides.
+    :param contents:
+        String contents read from the file.
     :return:
         Lobotomy data loaded from the file at the specified prefix.
     """
-    p = path.expanduser().absolute()
-    if not p.exists():
-        raise FileNotFoundError(f"Missing file {p}")
+    if _get_file_format_id(path, file_format) == "yaml":
+        # YAML files fall back to loading only the lobotomy data blocks when the
+        # entire file cannot be loaded, e.g. because of unregistered YAML tags.
+        return _read_yaml(contents, prefix, path.parent)
 
-    try:
-        output = _read_file_data(p, file_format) or {}
-    except yaml.constructor.ConstructorError:
-        return _read_yaml(p.read_text(), prefix, p.parent)
+    return _get_lobotomy_data(_read_file_data(path, file_format, contents), prefix)
 
-    for key in prefix:
-        output = output.get(key) or {}
-    return {k: v for k, v in output.items() if k in ("clients", "sessions")}
+
+@functools.lru_cache(maxsize=128)
+def _read_file_cached(
+    path: pathlib.Path,
+    file_format: typing.Optional[str],
+    prefix: typing.Tuple[str, ...],
+    contents: str,
+) -> dict:
+    """
+    Load the lobotomy data from the contents of the file and cache it.
+
+    The contents of the file are part of the cache key so that any change to the
+    file is loaded again instead of returning stale data. The data returned here
+    must not be modified as it is shared among all callers.
+    """
+    return _read_file(path, file_format, prefix, contents)
 
 
 def read(
@@ -278,7 +392,17 @@ def read(
         given file. This will be an empty dictionary if no configuration
         exists yet.
     """
-    return _read_file(pathlib.Path(path), file_format, _get_prefix(prefix))
+    p = pathlib.Path(path).expanduser().absolute()
+    try:
+        contents = p.read_text()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing file {p}") from None
+
+    # Test suites commonly read the same configuration file for many tests. Reading
+    # the file is cheap compared to parsing it, so the loaded data is cached by the
+    # file contents and a copy of it returned for the caller to modify.
+    data = _read_file_cached(p, file_format, tuple(_get_prefix(prefix)), contents)
+    return copy.deepcopy(data)
 
 
 def _update_yaml_write_lines(
@@ -321,6 +445,8 @@ def _update_yaml_write_lines(
         indent = _indent_regex.match(lines[index]).group("indent")  # type: ignore
 
     if data := configs.get(block.key):
+        import yaml
+
         new_body = [textwrap.indent(yaml.dump({block.key: data}), indent).rstrip()]
     else:
         # Don't include the body if the configuration is empty.
@@ -352,7 +478,7 @@ def _write_modified_yaml(
     :param prefix:
         Key hierarchy where the lobotomy data will be written within the file.
     """
-    body = textwrap.dedent(path.read_text().strip().replace("\r", ""))
+    body = _dedent(path.read_text().strip().replace("\r", ""))
     lines = body.split("\n")
     clients_block, sessions_block, parent_block = _extract(body, prefix)
 
@@ -394,7 +520,7 @@ def _get_data_for_write(
         of the root at the location specified by the prefix keys.
     """
     if path.exists():
-        root = _read_file_data(path, file_format)
+        root = _read_file_data(path, file_format, path.read_text())
     else:
         root = {}
 
@@ -408,14 +534,15 @@ def _get_data_for_write(
 
 
 def _get_file_format_id(path: pathlib.Path, file_format: typing.Optional[str]) -> str:
-    """Determine the file format for writing based on the arguments."""
-    formats = {
-        "yaml": path.name.endswith((".yml", ".yaml")),
-        "toml": path.name.endswith(".toml"),
-        "json": path.name.endswith(".json"),
-    }
-    finder = (k for k, v in formats.items() if file_format == k or v)
-    return next(finder, "json")
+    """Determine the file format for reading or writing based on the arguments."""
+    name = path.name
+    suffix = name[name.rfind(".") :] if "." in name else ""
+    formats = (file_format, _FILE_FORMATS_BY_SUFFIX.get(suffix))
+    if "yaml" in formats:
+        return "yaml"
+    if "toml" in formats:
+        return "toml"
+    return "json"
 
 
 def write(
@@ -459,11 +586,14 @@ def write(
     data, parent = _get_data_for_write(p, format_id, prefix_keys)
     parent.update(source)
 
-    writers = {
-        "yaml": lambda: yaml.dump(data),
-        "toml": lambda: toml.dumps(data),
-        "json": lambda: json.dumps(data, indent=2),
-    }
+    if format_id == "yaml":
+        import yaml
 
-    contents = writers[format_id]()
+        contents = yaml.dump(data)
+    elif format_id == "toml":
+        import toml
+
+        contents = toml.dumps(data)
+    else:
+        contents = json.dumps(data, indent=2)
     p.write_text(contents)
@@ -5,6 +5,20 @@ from unittest.mock import patch as mock_patch
 import lobotomy as lbm
 
 
+def _copy_containers(value: typing.Any) -> typing.Any:
+    """
+    Copy the dictionaries and lists within the patch data.
+
+    Other values are kept by reference so that callable responses, e.g. mocks
+    passed in by the user, are the objects that are called and inspected.
+    """
+    if isinstance(value, dict):
+        return {k: _copy_containers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(v) for v in value]
+    return value
+
+
 class Patch:
     """
     Patching decorator/ContextManager class for general lobotomy use.
@@ -60,11 +74,12 @@ class Patch:
         Create the lobotomy object to be used during the patch lifetime.
 
         This has to be created with each call to prevent multiple scenario
-        executions for the same test function.
+        executions for the same test function. The containers within the data
+        are copied as responses are consumed from them in place as calls are made.
         """
         if self.data is not None:
             return lbm.Lobotomy(
-                self.data.copy(),
+                _copy_containers(self.data),
                 client_overrides=self.client_overrides,
             )
         elif self.path:
@@ -27,31 +27,26 @@ def add_service_response(
     :return:
         Nothing. The lobotomy data is mutated in place.
     """
-    if "clients" not in lobotomy_data:
-        lobotomy_data["clients"] = {}
-
-    if method.service.name not in lobotomy_data["clients"]:
-        lobotomy_data["clients"][method.service.name] = {}
-
-    service_data = lobotomy_data["clients"][method.service.name]
-    response_type = method.output.get("type", "structure")
+    clients = lobotomy_data.setdefault("clients", {})
+    service_data = clients.setdefault(method.service.name, {})
     if response is None:
         new_response = method.configuration_output
     else:
         new_response = response
 
-    if method.name not in service_data:
-        if response_type == "list":
+    method_name = method.name
+    if method_name not in service_data:
+        if method.output.get("type", "structure") == "list":
             # List entries confuse the side effect behavior of popping
             # responses off the list. To avoid that the list responses
             # are added as list items.
-            service_data[method.name] = [new_response]
+            service_data[method_name] = [new_response]
         else:
-            service_data[method.name] = new_response
+            service_data[method_name] = new_response
         return
 
-    existing = service_data[method.name]
+    existing = service_data[method_name]
     if isinstance(existing, dict):
-        service_data[method.name] = [existing, new_response]
+        service_data[method_name] = [existing, new_response]
     else:
-        service_data[method.name] = existing + [new_response]
+        existing.append(new_response)
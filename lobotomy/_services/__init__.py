@@ -1,7 +1,15 @@
+import functools
+
 from lobotomy._services._definitions import Method  # noqa: F401
 from lobotomy._services._definitions import Service  # noqa: F401
 
 
+@functools.lru_cache(maxsize=None)
 def load_definition(service_name: str) -> "Service":
-    """Load client definition data for the associated AWS service."""
+    """
+    Load client definition data for the associated AWS service.
+
+    Service definitions are read-only once loaded and so they are cached for reuse
+    by subsequent calls for the same service within the process.
+    """
     return Service(service_name)
@@ -1,14 +1,24 @@
 import dataclasses
+import functools
 import importlib.resources
 import json
+import os
 import pathlib
 import typing
 
 import botocore
-import yaml
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 from lobotomy._services import _formatting
 
+#: Sentinel for keys that are missing in nested lookups, which is distinct from
+#: None values that are present in the data.
+_MISSING = object()
+
 
 @dataclasses.dataclass(frozen=True)
 class DataWrapper:
@@ -30,11 +40,11 @@ class DataWrapper:
         instead. However, if a falsy value is found for the key, including None, that
         will be returned instead.
         """
-        value = self.data or {}
+        value = self.data or _formatting._EMPTY
         for k in args:
-            if k not in value:
+            value = value.get(k, _MISSING)
+            if value is _MISSING:
                 return default
-            value = value[k]
         return value
 
 
@@ -49,22 +59,49 @@ class Method(DataWrapper):
     #: Service in which this method resides.
     service: "Service"
 
-    @property
+    @functools.cached_property
     def input(self) -> dict:
-        """Fetch definition for the input signature of this method."""
+        """
+        Fetch definition for the input signature of this method.
+
+        The returned definition is read-only. It shares nested shape definitions
+        with the other methods of the service that use the same shapes.
+        """
         return _formatting.parse_definition_item(
             self.service.shapes,
             self.get("input") or {},
+            cache=self.service._parsed_shapes,
         )
 
-    @property
+    @functools.cached_property
     def output(self) -> dict:
-        """Fetch definition for the output/response signature of this method."""
+        """
+        Fetch definition for the output/response signature of this method.
+
+        The returned definition is read-only. It shares nested shape definitions
+        with the other methods of the service that use the same shapes.
+        """
         return _formatting.parse_definition_item(
             self.service.shapes,
             self.get("output") or {},
+            cache=self.service._parsed_shapes,
         )
 
+    @functools.cached_property
+    def input_keys(self) -> typing.Tuple[str, ...]:
+        """Fetch the names of the input arguments in the order they are defined."""
+        return tuple(self.input.get("members") or _formatting._EMPTY)
+
+    @functools.cached_property
+    def input_key_set(self) -> typing.FrozenSet[str]:
+        """Fetch the names of the input arguments for membership comparisons."""
+        return frozenset(self.input_keys)
+
+    @functools.cached_property
+    def required_input_keys(self) -> typing.FrozenSet[str]:
+        """Fetch the names of the input arguments that are required."""
+        return frozenset(self.input.get("required") or ())
+
     @property
     def configuration_output(self) -> typing.Any:
         """
@@ -90,11 +127,26 @@ class Service(DataWrapper):
     data: dict = dataclasses.field(init=False, default_factory=lambda: {})
     #: The exceptions for the associated service.
     exceptions: dict = dataclasses.field(init=False, default_factory=lambda: {})
+    #: Shape definitions that have been parsed, cached by their shape names and
+    #: the depth at which they were parsed.
+    _parsed_shapes: typing.Dict[typing.Tuple[str, int], dict] = dataclasses.field(
+        init=False,
+        default_factory=lambda: {},
+        repr=False,
+        compare=False,
+    )
+    #: Method definitions that have been looked up, cached by their method names.
+    _methods: typing.Dict[str, "Method"] = dataclasses.field(
+        init=False,
+        default_factory=lambda: {},
+        repr=False,
+        compare=False,
+    )
 
     def __post_init__(self):
         """Load the service specification into the object."""
         self.data.update(_get_specification(self.name))
-        self.exceptions.update(_get_exceptions(self.data))
+        self.exceptions.update(_get_exceptions(self.name))
 
     @property
     def version(self) -> str:
@@ -132,24 +184,47 @@ class Service(DataWrapper):
 
     def has(self, method_name: str) -> bool:
         """Determine whether the spec defines the given method."""
-        value = method_name.lower().replace("_", "")
-        return value in self.operations
+        return self.find(method_name) is not None
+
+    def find(self, method_name: str) -> typing.Optional["Method"]:
+        """
+        Fetch the Method data for the associated method name if it is defined.
+
+        Methods are cached once found so that repeated lookups of the same method
+        name are a single dictionary access.
+
+        :param method_name:
+            The snake_case name of the client method to find.
+        :return:
+            The Method data for the method name or None if the spec does not define
+            the method.
+        """
+        method = self._methods.get(method_name)
+        if method is None:
+            data = self.operations.get(method_name.lower().replace("_", ""))
+            if data is None:
+                return None
+            method = Method(name=method_name, data=data, service=self)
+            self._methods[method_name] = method
+        return method
 
     def lookup(self, method_name: str) -> "Method":
         """Fetch the Method data for the associated method name."""
-        value = method_name.lower().replace("_", "")
-        return Method(
+        return self.find(method_name) or Method(
             name=method_name,
-            data=self.operations.get(value) or {},
+            data={},
             service=self,
         )
 
 
+@functools.lru_cache(maxsize=None)
 def _get_specification(service_name: str) -> dict:
     """
     Load the service specification data for the given service name.
 
     This data is loaded from the installed botocore library for maximum compatibility.
+    Loaded specifications are cached and shared by all Service objects for the
+    service name, which must treat them as read-only.
 
     :param service_name:
         Name of the service to load, which corresponds with the name that
@@ -164,16 +239,11 @@ def _get_specification(service_name: str) -> dict:
     directory = (
         pathlib.Path(botocore.__file__).parent.joinpath("data", service_name).absolute()
     )
-    folder = next(
-        (
-            n
-            for n in sorted(directory.iterdir(), reverse=True)
-            if n.name.startswith("20")
-        )
-    )
-    spec = json.loads(
-        directory.joinpath(folder, "service-2.json").read_text(encoding="utf-8")
-    )
+    # The latest API version is the greatest of the dated version folder names.
+    with os.scandir(directory) as entries:
+        folder = max(e.name for e in entries if e.name.startswith("20"))
+    contents = directory.joinpath(folder, "service-2.json").read_bytes()
+    spec = orjson.loads(contents) if orjson is not None else json.loads(contents)
 
     # Augment the botocore service definitions with client additions added by boto3
     # for non-standard api operations. The notable example here is s3.upload_file,
@@ -182,35 +252,44 @@ def _get_specification(service_name: str) -> dict:
     package = f"{__package__}._augmentations"
     resource_name = f"{service_name}.yaml"
     if importlib.resources.is_resource(package, resource_name):
-        extras = yaml.full_load(importlib.resources.read_text(package, resource_name))
+        import yaml
+
+        # The augmentations are plain data and so the libyaml backed safe loader
+        # is used when available as it is much faster than the default loader.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        source = importlib.resources.read_text(package, resource_name)
+        extras = yaml.load(source, Loader=loader)
 
-        for key, value in (extras.get("operations") or {}).items():
+        for key, value in (extras.get("operations") or _formatting._EMPTY).items():
             spec["operations"][key] = value
 
-        for key, value in (extras.get("shapes") or {}).items():
+        for key, value in (extras.get("shapes") or _formatting._EMPTY).items():
             spec["shapes"][key] = value
 
     spec["operations"] = {k.lower(): v for k, v in spec["operations"].items()}
     return spec
 
 
-def _get_exceptions(specification: dict) -> typing.Dict[str, dict]:
+@functools.lru_cache(maxsize=None)
+def _get_exceptions(service_name: str) -> typing.Dict[str, dict]:
     """
     Assemble a mapping of client exceptions raised by the methods.
 
-    These are extracted from the specified service specification where the values are
+    These are extracted from the service specification where the values are
     the shape mappings for those exceptions as specified in the service specification.
+    The mappings are cached in the same way as the specifications themselves.
 
-    :param specification:
-        Botocore service specification from which to extract exception
-        information.
+    :param service_name:
+        Name of the service for the botocore service specification from which
+        to extract exception information.
     :return:
         Dictionary of exception names and their corresponding shapes
         set on the client.exceptions object.
     """
-    errors = {
-        error["shape"]
+    specification = _get_specification(service_name)
+    shapes = specification["shapes"]
+    return {
+        error["shape"]: shapes[error["shape"]]
         for item in specification["operations"].values()
-        for error in (item.get("errors") or [])
+        for error in (item.get("errors") or ())
     }
-    return {e: specification["shapes"][e] for e in errors}
@@ -1,9 +1,41 @@
-import copy
 import datetime
+import types
 import typing
 
+#: Shared read-only empty mapping used in place of missing optional mappings.
+_EMPTY: typing.Mapping[str, typing.Any] = types.MappingProxyType({})
 
-def parse_definition_item(shapes: dict, value: dict, max_depth: int = 10) -> dict:
+#: Placeholder values for the scalar data types in flat casts of definitions.
+_FLAT_VALUES: typing.Dict[str, typing.Any] = {
+    "blob": "...",
+    "string": "...",
+    "integer": 1,
+    "long": 1,
+    "float": 1.0,
+}
+
+
+def _copy_definition(value: typing.Any) -> typing.Any:
+    """
+    Deep copy the definition value from a service specification.
+
+    Specifications only contain JSON data types, so this is a much faster
+    alternative to copy.deepcopy that only needs to handle dicts and lists.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {k: _copy_definition(v) for k, v in value.items()}
+    if value_type is list:
+        return [_copy_definition(v) for v in value]
+    return value
+
+
+def parse_definition_item(
+    shapes: dict,
+    value: dict,
+    max_depth: int = 10,
+    cache: typing.Optional[typing.Dict[typing.Tuple[str, int], dict]] = None,
+) -> dict:
     """
     Unwrap the value object by placing its shape data within a copy of the object.
 
@@ -20,6 +52,11 @@ def parse_definition_item(shapes: dict, value: dict, max_depth: int = 10) -> dic
         Max recursion of the parsing before the process aborts. This prevents circular
         reference issues in cases like dynamoDB table definitions where the definitions
         map back and forth.
+    :param cache:
+        Optional dictionary in which parsed shapes are stored by their shape names
+        and the depth at which they were parsed for reuse in subsequent parsing.
+        Parsed shapes stored in the cache are shared by all of the definitions in
+        which they are used and so those definitions must not be modified.
     :return:
         An unwrapped, deep-copied version of the value dictionary where
         the shape(s) have been injected into the object hierarchically to
@@ -27,7 +64,7 @@ def parse_definition_item(shapes: dict, value: dict, max_depth: int = 10) -> dic
         including types, of the value and potentially its member(s) if
         represents a list or dictionary.
     """
-    output = copy.deepcopy(value)
+    output = _copy_definition(value)
     depth = max_depth - 1
     if depth < 0:
         # In cases where recursion is a problem, force an exit and set the
@@ -38,27 +75,48 @@ def parse_definition_item(shapes: dict, value: dict, max_depth: int = 10) -> dic
 
     if value.get("type") == "map":
         # Maps are terminal but have key and value shapes.
-        output["key"] = parse_definition_item(shapes, value["key"], depth)
-        output["value"] = parse_definition_item(shapes, value["value"], depth)
+        output["key"] = parse_definition_item(shapes, value["key"], depth, cache)
+        output["value"] = parse_definition_item(shapes, value["value"], depth, cache)
 
     if "member" in output:
         # Types like lists have a member definition for the items in the
         # list. That needs to be parsed and then the shape is complete.
-        output["member"] = parse_definition_item(shapes, output["member"], depth)
+        output["member"] = parse_definition_item(shapes, output["member"], depth, cache)
 
     if "members" in output:
         output["members"] = {
-            k: parse_definition_item(shapes, v, depth)
-            for k, v in (output["members"] or {}).items()
+            k: parse_definition_item(shapes, v, depth, cache)
+            for k, v in (output["members"] or _EMPTY).items()
         }
 
     if "shape" in output:
-        shape = copy.deepcopy(shapes[output["shape"]])
-        output.update(parse_definition_item(shapes, shape, depth))
+        output.update(_parse_shape(shapes, output["shape"], depth, cache))
 
     return output
 
 
+def _parse_shape(
+    shapes: dict,
+    name: str,
+    depth: int,
+    cache: typing.Optional[typing.Dict[typing.Tuple[str, int], dict]],
+) -> dict:
+    """
+    Parse the named shape at the given depth, reusing it from the cache if present.
+
+    The parsed shape depends on the depth at which it is parsed because of the
+    recursion limit and so that is part of the cache key. The shape is copied
+    as it is parsed and so it isn't copied here.
+    """
+    key = (name, depth)
+    parsed = None if cache is None else cache.get(key)
+    if parsed is None:
+        parsed = parse_definition_item(shapes, shapes[name], depth, cache)
+        if cache is not None:
+            cache[key] = parsed
+    return parsed
+
+
 def flat_cast(output: dict) -> typing.Any:
     """
     Create a flat version of the output.
@@ -66,19 +124,19 @@ def flat_cast(output: dict) -> typing.Any:
     Default will be included for inclusion as a skeleton in a configuration
     response file.
     """
-    o = output
-    data_type = o.get("type", "structure")
-    type_casts = {
-        "blob": lambda: "...",
-        "string": lambda: "...",
-        "integer": lambda: 1,
-        "long": lambda: 1,
-        "float": lambda: 1.0,
-        "timestamp": lambda: f'{datetime.datetime.utcnow().isoformat("T")}Z',
-        "list": lambda: [flat_cast(o["member"])],
-        # Some calls have empty requests or responses that have no members and so here
-        # we allow for the empty possibility for the structure type.
-        "structure": lambda: {k: flat_cast(v) for k, v in o.get("members", {}).items()},
-    }
-    caster = type_casts.get(data_type, lambda: None)
-    return caster()
+    data_type = output.get("type", "structure")
+    if data_type in _FLAT_VALUES:
+        return _FLAT_VALUES[data_type]
+
+    if data_type == "timestamp":
+        return f'{datetime.datetime.utcnow().isoformat("T")}Z'
+
+    if data_type == "list":
+        return [flat_cast(output["member"])]
+
+    if data_type == "structure":
+        # Some calls have empty requests or responses that have no members and so
+        # here we allow for the empty possibility for the structure type.
+        return {k: flat_cast(v) for k, v in output.get("members", {}).items()}
+
+    return None
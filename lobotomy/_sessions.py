@@ -1,4 +1,3 @@
-import dataclasses
 import pathlib
 import typing
 from unittest.mock import MagicMock
@@ -20,8 +19,7 @@ def _get_key(
     return (source or {}).get(key, default)
 
 
-@dataclasses.dataclass(frozen=True)
-class ServiceCall:
+class ServiceCall(typing.NamedTuple):
     """Data structure for recording service calls made on clients."""
 
     #: Name of the service in which this call was made.
@@ -55,9 +53,12 @@ class ReadOnlyCredentials(typing.NamedTuple):
 class Credentials:
     """Mock botocore Credentials object used by Session.get_credentials."""
 
+    __slots__ = ("_data", "_frozen")
+
     def __init__(self, data: dict = None):
         """Store configuration data for access."""
         self._data = data or {}
+        self._frozen: typing.Optional[ReadOnlyCredentials] = None
 
     @property
     def method(self) -> str:
@@ -80,13 +81,36 @@ class Credentials:
         return self._data.get("token")
 
     def get_frozen_credentials(self) -> "ReadOnlyCredentials":
-        """Fetch a named-tuple form of the credentials for the associated session."""
-        return ReadOnlyCredentials(self.access_key, self.secret_key, self.token)
+        """
+        Fetch a named-tuple form of the credentials for the associated session.
+
+        This is created on the first call and reused afterwards as the credentials
+        do not change over the lifetime of this object.
+        """
+        if self._frozen is None:
+            self._frozen = ReadOnlyCredentials(
+                self.access_key,
+                self.secret_key,
+                self.token,
+            )
+        return self._frozen
 
 
 class Session:
     """Mock boto3.Session object used in place of the real one during lobotomy tests."""
 
+    # A __dict__ is kept so that, as with boto3 sessions, attributes can be set
+    # on the session or patched, e.g. with unittest.mock.patch.object.
+    __slots__ = (
+        "lobotomy",
+        "_events",
+        "_constructed",
+        "_definition",
+        "_data",
+        "_clients",
+        "__dict__",
+    )
+
     def __init__(
         self,
         aws_access_key_id: str = None,
@@ -99,7 +123,7 @@ class Session:
     ):
         """Mock session object to replace the standard boto3.Session."""
         self.lobotomy: Lobotomy = source_lobotomy or Lobotomy()
-        self.events = MagicMock()
+        self._events: typing.Optional[MagicMock] = None
 
         self._constructed = {
             "aws_access_key_id": aws_access_key_id,
@@ -110,12 +134,28 @@ class Session:
             "profile_name": profile_name,
         }
         self._definition = self.lobotomy.get_session_data()
-        self._data = {
-            **self._definition,
-            **{k: v for k, v in self._constructed.items() if v is not None},
-        }
+        self._data = dict(self._definition)
+        for key, value in self._constructed.items():
+            if value is not None:
+                self._data[key] = value
         self._clients: typing.Dict[str, "lobotomy.Client"] = {}
 
+    @property
+    def events(self) -> MagicMock:
+        """
+        Mock the event system of the session.
+
+        This is created on first access as most uses of the session never need it.
+        """
+        if self._events is None:
+            self._events = MagicMock()
+        return self._events
+
+    @events.setter
+    def events(self, value: MagicMock):
+        """Replace the mocked event system of the session."""
+        self._events = value
+
     @property
     def profile_name(self) -> typing.Optional[str]:
         """Fetch optional name of the AWS profile used for the session if set."""
@@ -142,18 +182,19 @@ class Session:
         Each service-client is a singleton such that subsequent calls for the
         same service name will return the same object.
         """
-        override = self.lobotomy.get_client_override(service_name)
-        if override is not None:
-            return override
-
-        if service_name not in self._clients:
-            self._clients[service_name] = lobotomy.Client(
-                self,
-                service_name,
-                *args,
-                **kwargs,
-            )
-        return self._clients[service_name]
+        # Overrides are checked on each call as they can be added to or removed
+        # from the lobotomy after the session has been created.
+        if self.lobotomy._client_overrides:
+            override = self.lobotomy.get_client_override(service_name)
+            if override is not None:
+                return override
+
+        try:
+            return self._clients[service_name]
+        except KeyError:
+            client = lobotomy.Client(self, service_name, *args, **kwargs)
+            self._clients[service_name] = client
+            return client
 
 
 class Lobotomy:
@@ -172,6 +213,11 @@ class Lobotomy:
         self.data = data or {}
         self._client_overrides = client_overrides or {}
         self._service_calls: typing.List[ServiceCall] = []
+        #: Recorded service calls grouped by their service and method names for
+        #: lookups without scanning all of the recorded calls.
+        self._service_calls_by_method: typing.Dict[
+            typing.Tuple[str, str], typing.List[ServiceCall]
+        ] = {}
 
     @property
     def service_calls(self) -> typing.Tuple["ServiceCall", ...]:
@@ -202,7 +248,7 @@ class Lobotomy:
             Nth-specified service call for the given service and method names. If no
             such call exists, an IndexError will be raised.
         """
-        return self.get_service_calls(service_name, method_name)[index]
+        return self._service_calls_by_method.get((service_name, method_name), [])[index]
 
     def get_service_calls(
         self,
@@ -220,11 +266,7 @@ class Lobotomy:
             Name of the AWS boto3 method to be called for this response within the
             specified service.
         """
-        return [
-            s
-            for s in self._service_calls
-            if s.service == service_name and s.method == method_name
-        ]
+        return list(self._service_calls_by_method.get((service_name, method_name), ()))
 
     def add_client_override(self, service_name: str, client: typing.Any) -> "Lobotomy":
         """
@@ -359,6 +401,8 @@ class Lobotomy:
             Service call to record within the lobotomy instance.
         """
         self._service_calls.append(service_call)
+        key = (service_call.service, service_call.method)
+        self._service_calls_by_method.setdefault(key, []).append(service_call)
 
     def pop_response(
         self,
@@ -382,7 +426,12 @@ class Lobotomy:
             A response object containing the lobotomized response for the given
             service method call.
         """
-        response = self.data.get("clients", {}).get(service_name, {}).get(method_name)
+        try:
+            response = self.data["clients"][service_name][method_name]
+        except (KeyError, TypeError):
+            # A TypeError is raised when one of the levels is empty in the data,
+            # e.g. a "clients:" key without any values in a YAML file.
+            response = None
 
         if response is None:
             raise lobotomy.NoResponseFound(
@@ -0,0 +1,3 @@
+# This value must be kept in sync with the version in the pyproject.toml file,
+# which is enforced by the lobotomy.tests.test_version test.
+__version__ = "0.3.10"
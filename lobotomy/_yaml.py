@@ -6,6 +6,10 @@ import typing
 import yaml
 import yaml.constructor
 
+#: YAML loader used to read lobotomy configuration files. This is the libyaml
+#: backed version of the full loader when available as it is considerably faster.
+Loader = getattr(yaml, "CFullLoader", yaml.FullLoader)
+
 
 @dataclasses.dataclass()
 class YamlModifier:
@@ -47,6 +51,7 @@ class YamlModifier:
     def register(cls):
         """Register the comparator with the PyYaml loader."""
         yaml.add_constructor(cls.label(), cls.parse_yaml)
+        yaml.add_constructor(cls.label(), cls.parse_yaml, Loader=Loader)
         yaml.add_representer(cls, cls.dump_yaml)
 
 
@@ -1,3 +1,5 @@
+import re
+
 import lobotomy
 
 
@@ -7,3 +9,15 @@ def test_generate_presigned_url(lobotomized: lobotomy.Lobotomy):
     client = lobotomized().client("sts")
     result = client.generate_presigned_url("get_caller_identity")
     assert result.startswith("https://sts.")
+
+
+@lobotomy.patch()
+def test_generate_presigned_url_date(lobotomized: lobotomy.Lobotomy):
+    """Should include the signing date in the AWS basic format in the URL."""
+    client = lobotomized().client("s3")
+    result = client.generate_presigned_url("get_object", ExpiresIn=60)
+    assert "?Action=GetObject&" in result
+    assert "&X-Amz-Expires=60&" in result
+    date = result.split("&X-Amz-Date=")[1].split("&")[0]
+    assert re.fullmatch(r"\d{8}T\d{6}Z", date)
+    assert f"%2F{date[:8]}%2F" in result
@@ -7,3 +7,22 @@ def test_lambda_invoke(lobotomized: lobotomy.Lobotomy):
     lobotomized.add_call("lambda", "invoke")
     response = lobotomized().client("lambda").invoke(FunctionName="foo")
     assert b"..." == response["Payload"].read()
+
+
+@lobotomy.patch()
+def test_lambda_invoke_chunked(lobotomized: lobotomy.Lobotomy):
+    """Should return bytes chunks when reading the payload in chunks."""
+    lobotomized.add_call("lambda", "invoke", {"Payload": "abcdefghij"})
+    response = lobotomized().client("lambda").invoke(FunctionName="foo")
+    chunks = list(response["Payload"].iter_chunks(chunk_size=4))
+    assert chunks == [b"abcd", b"efgh", b"ij"]
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+
+
+@lobotomy.patch()
+def test_lambda_invoke_socket_timeout(lobotomized: lobotomy.Lobotomy):
+    """Should allow setting the socket timeout on the payload streaming body."""
+    lobotomized.add_call("lambda", "invoke")
+    response = lobotomized().client("lambda").invoke(FunctionName="foo")
+    response["Payload"].set_socket_timeout(10)
+    assert b"..." == response["Payload"].read()
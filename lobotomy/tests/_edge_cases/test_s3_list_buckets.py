@@ -0,0 +1,13 @@
+import lobotomy
+
+
+@lobotomy.Patch()
+def test_s3_list_buckets(lobotomized: lobotomy.Lobotomy):
+    """
+    Should handle s3.list_buckets without error despite edge case
+    configuration in botocore service method definitions where the method
+    has no input structure.
+    """
+    lobotomized.add_call("s3", "list_buckets", {"Buckets": [{"Name": "a"}]})
+    response = lobotomized().client("s3").list_buckets()
+    assert response["Buckets"][0]["Name"] == "a"
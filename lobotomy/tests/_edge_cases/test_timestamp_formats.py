@@ -11,6 +11,7 @@ values = [
     "2020-01-01T12:23:34",
     "2020-01-01T12:23:34Z",
     "2020-01-01T12:23:34+00:00",
+    "Jan 1 2020 12:23:34",
     datetime.date(2020, 1, 1),
     datetime.datetime(2020, 1, 1, 12, 23, 34, tzinfo=None),
     datetime.datetime(2020, 1, 1, 12, 23, 34, tzinfo=datetime.timezone.utc),
@@ -10,6 +10,8 @@ def make_path(
     path = MagicMock()
     path.name = f"foo.{file_format}"
     path.exists.return_value = exists
+    if not exists:
+        path.read_text.side_effect = FileNotFoundError()
     path.read_text.return_value = data
     path.expanduser.return_value = path
     path.absolute.return_value = path
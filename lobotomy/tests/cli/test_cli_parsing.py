@@ -0,0 +1,41 @@
+import typing
+
+import pytest
+from pytest import mark
+
+from lobotomy._cli import _parsing
+
+scenarios = [
+    ["add", "sts.get_caller_identity", "-"],
+    ["add", "sts.get_caller_identity", "foo.yaml", "--format=json"],
+    ["add", "sts.get_caller_identity", "foo.yaml", "--file-format", "toml"],
+    ["add", "--prefix", "foo.bar", "sts.get_caller_identity", "foo.yaml"],
+    ["add", "sts.get_caller_identity", "foo.yaml", "--prefix=foo", "--format=yaml"],
+    ["add", "sts.get_caller_identity", "foo.yaml", "--form", "json"],
+    ["add", "sts.get_caller_identity", "foo.yaml", "--format=yaml", "--format=json"],
+]
+
+
+@mark.parametrize("arguments", scenarios)
+def test_parse(arguments: typing.List[str]):
+    """Should parse the arguments in the same way as the argparse parser."""
+    expected = _parsing._create_parser().parse_args(args=arguments)
+    assert _parsing.parse(arguments) == expected
+
+
+@mark.parametrize(
+    "arguments",
+    [
+        ["add", "sts.get_caller_identity"],
+        ["add", "sts.get_caller_identity", "foo.yaml", "--format=xml"],
+        ["add", "sts.get_caller_identity", "foo.yaml", "--format=xml", "--format=json"],
+        ["add", "sts.get_caller_identity", "foo.yaml", "--format", "xml", "--prefix=a"],
+        ["add", "sts.get_caller_identity", "foo.yaml", "--prefix"],
+        ["add", "sts.get_caller_identity", "foo.yaml", "--foo"],
+        ["add", "--help"],
+    ],
+)
+def test_parse_errors(arguments: typing.List[str]):
+    """Should defer to argparse for invalid arguments."""
+    with pytest.raises(SystemExit):
+        _parsing.parse(arguments)
@@ -0,0 +1,27 @@
+import lobotomy
+from lobotomy._clients import _casting
+
+string_list = {"type": "list", "member": {"type": "string"}}
+
+
+def test_cast_list_strings():
+    """Should cast the items of a string list into strings."""
+    value = ["foo", 42, lobotomy.ToJson({"bar": 1})]
+    observed = _casting.cast(string_list, value)
+    assert observed == ["foo", "42", '{"bar": 1}']
+
+
+def test_cast_list_no_member():
+    """Should return list items as-is when there is no member definition."""
+    value = ["foo", 42]
+    observed = _casting.cast({"type": "list"}, value)
+    assert observed == value
+    assert observed is not value
+
+
+def test_cast_list_integers():
+    """Should cast the items of an integer list into integers."""
+    value = [1, "2", 3.0, True]
+    observed = _casting.cast({"type": "list", "member": {"type": "long"}}, value)
+    assert observed == [1, 2, 3, 1]
+    assert all(type(v) is int for v in observed)
@@ -1,4 +1,7 @@
+import copy
 import pathlib
+import pickle
+import typing
 
 import boto3
 import pytest
@@ -29,6 +32,17 @@ def test_no_data_specified(*args):
         session.client("s3").put_object()
 
 
+@pytest.mark.parametrize(
+    "data",
+    [{}, {"clients": None}, {"clients": {}}, {"clients": {"s3": None}}],
+)
+def test_no_response_data(data: dict):
+    """Should raise error when any level of the response data is missing."""
+    lob = lobotomy.Lobotomy(data=data)
+    with pytest.raises(lobotomy.NoResponseFound):
+        lob.pop_response("s3", "list_buckets")
+
+
 @lobotomy.Patch()
 def test_missing_request_arguments(lobotomized: lobotomy.Lobotomy):
     """Should fail due to missing "Bucket" request argument."""
@@ -49,6 +63,17 @@ def test_unknown_request_arguments(lobotomized: lobotomy.Lobotomy):
         client.list_objects(Bucket="foo", Foo="bar")
 
 
+@lobotomy.Patch()
+def test_ignored_request_arguments(lobotomized: lobotomy.Lobotomy):
+    """Should ignore unknown arguments starting with an underscore."""
+    lobotomized.add_call("s3", "list_objects", [{}, {}])
+    session = boto3.Session()
+    client = session.client("s3")
+    client.list_objects(Bucket="foo", _Foo="bar")
+    with pytest.raises(lobotomy.RequestValidationError, match="'Foo'"):
+        client.list_objects(Bucket="foo", _Foo="bar", Foo="bar")
+
+
 @lobotomy.Patch()
 def test_bad_casting(lobotomized: lobotomy.Lobotomy):
     """Should fail to cast dictionary as string."""
@@ -88,3 +113,46 @@ def test_client_error_convenience(lobotomized: lobotomy.Lobotomy):
     client = session.client("s3")
     with pytest.raises(client.exceptions.NoSuchBucket):
         client.list_objects(Bucket="foo")
+
+
+@lobotomy.patch()
+def test_client_error_shared_types(lobotomized: lobotomy.Lobotomy):
+    """Should share the error types among clients of the same service."""
+    lobotomized.add_error_call("s3", "list_objects", "NoSuchBucket", "Hello...")
+    client = lobotomized().client("s3")
+    other_client = lobotomized().client("s3")
+    assert client is not other_client
+
+    with pytest.raises(other_client.exceptions.NoSuchBucket):
+        client.list_objects(Bucket="foo")
+
+
+def test_client_exceptions():
+    """Should resolve service error types from the client exceptions object."""
+    client = lobotomy.Lobotomy()().client("s3")
+    assert client.exceptions.ClientError is lobotomy.ClientError
+    assert client.exceptions.from_code("NoSuchBucket") is client.exceptions.NoSuchBucket
+    assert client.exceptions.from_code("FooBar") is lobotomy.ClientError
+    assert issubclass(client.exceptions.NoSuchBucket, lobotomy.ClientError)
+    with pytest.raises(AttributeError):
+        client.exceptions.FooBar
+
+
+def test_client_exceptions_copy():
+    """Should copy the client exceptions object with its error types."""
+    exceptions = lobotomy.Lobotomy()().client("s3").exceptions
+    observed = copy.copy(exceptions)
+    assert observed.NoSuchBucket is exceptions.NoSuchBucket
+    with pytest.raises(AttributeError):
+        observed._foo
+
+
+@pytest.mark.parametrize(
+    "duplicate",
+    [copy.copy, copy.deepcopy, lambda e: pickle.loads(pickle.dumps(e))],
+)
+def test_client_error_copy(duplicate: typing.Callable):
+    """Should keep the error code and message when copying client errors."""
+    error = lobotomy.ClientError().populate(Code="NoSuchBucket", Message="nope")
+    observed = duplicate(error)
+    assert observed.response == {"Error": {"Code": "NoSuchBucket", "Message": "nope"}}
@@ -1,4 +1,5 @@
 import json
+import os
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -84,3 +85,57 @@ def test_write_new_prefix(pathlib_path: MagicMock, scenario: dict):
     _fio.write(path, {"clients": "hello"}, ["foo", "bar"])
     assert path.write_text.call_args.args[0].find("get_caller_identity") > 0
     assert path.write_text.call_args.args[0].find("hello") > 0
+
+
+def test_read_cached(tmp_path):
+    """Should return copies of cached data until the file is modified."""
+    path = tmp_path.joinpath("lobotomy.json")
+    path.write_text(json.dumps(SOURCE_DATA))
+    first = _fio.read(path, "prefix.subprefix")
+    second = _fio.read(path, "prefix.subprefix")
+    assert first == second == SOURCE_DATA["prefix"]["subprefix"]
+
+    first["clients"]["sts"]["get_caller_identity"]["Account"] = "123"
+    assert _fio.read(path, "prefix.subprefix") == second
+
+    path.write_text(json.dumps({"clients": {"s3": {}}}))
+    assert _fio.read(path) == {"clients": {"s3": {}}}
+
+
+def test_read_cached_same_size_and_time(tmp_path):
+    """Should read changes that keep the size and modification time of the file."""
+    path = tmp_path.joinpath("lobotomy.json")
+    path.write_text(json.dumps({"clients": {"s3": {}}}))
+    stat = path.stat()
+    assert _fio.read(path) == {"clients": {"s3": {}}}
+
+    # Rewriting the file within a single tick of a coarse modification time
+    # resolution leaves both the size and the modification time unchanged.
+    path.write_text(json.dumps({"clients": {"s4": {}}}))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert path.stat().st_size == stat.st_size
+    assert _fio.read(path) == {"clients": {"s4": {}}}
+
+
+@mark.parametrize("contents", ['{"a": [1, "b"]}', '{"a": NaN}', '{"a": "\\u00e9"}'])
+def test_load_json(contents: str):
+    """Should load JSON contents the same way as the json module."""
+    assert json.dumps(_fio._load_json(contents)) == json.dumps(json.loads(contents))
+
+
+def test_load_json_invalid():
+    """Should raise the json module error for invalid JSON contents."""
+    with pytest.raises(json.JSONDecodeError):
+        _fio._load_json("{")
+
+
+def test_load_toml():
+    """Should load TOML contents the same way as the toml package."""
+    contents = toml.dumps(SOURCE_DATA)
+    assert _fio._load_toml(contents) == toml.loads(contents)
+
+
+def test_load_toml_invalid():
+    """Should raise the toml package error for invalid TOML contents."""
+    with pytest.raises(toml.TomlDecodeError):
+        _fio._load_toml("a = ")
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+
+import pytest
+
+import lobotomy
+
+
+def test_lazy_imports():
+    """Should not import heavy dependencies until a member is accessed."""
+    code = "; ".join(
+        [
+            "import sys",
+            "import lobotomy",
+            "assert 'botocore' not in sys.modules",
+            "assert 'yaml' not in sys.modules",
+            "lobotomy.Lobotomy",
+            "assert 'botocore' in sys.modules",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_imports_fio():
+    """Should not import yaml or toml until a file of that format is used."""
+    code = "; ".join(
+        [
+            "import sys",
+            "from lobotomy import _fio",
+            "assert 'yaml' not in sys.modules",
+            "assert 'toml' not in sys.modules",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_imports_clients():
+    """Should not import yaml or toml when creating sessions and clients."""
+    code = "; ".join(
+        [
+            "import sys",
+            "import lobotomy",
+            "lobotomy.Lobotomy()().client('sts')",
+            "assert 'yaml' not in sys.modules",
+            "assert 'toml' not in sys.modules",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_imports_members():
+    """Should resolve all public members and list them in the package dir."""
+    for name in lobotomy.__all__:
+        assert getattr(lobotomy, name) is not None
+        assert name in dir(lobotomy)
+
+
+def test_lazy_imports_missing():
+    """Should raise an AttributeError for unknown package members."""
+    with pytest.raises(AttributeError):
+        lobotomy.FooBar
@@ -16,3 +16,31 @@ def test_multiple_patches(
     assert str(os_path_getctime).find("getctime") > 0
     assert isinstance(lobotomized, lobotomy.Lobotomy)
     assert str(os_path_getmtime).find("getmtime") > 0
+
+
+def test_patch_data_reuse():
+    """Should start each patched call with the original patch data."""
+    data = {"clients": {"sts": {"get_caller_identity": [{"Account": "123"}]}}}
+
+    @lobotomy.Patch(data=data)
+    def get_account(lobotomized: lobotomy.Lobotomy) -> str:
+        return lobotomized().client("sts").get_caller_identity()["Account"]
+
+    assert get_account() == "123"
+    assert get_account() == "123"
+    assert data["clients"]["sts"]["get_caller_identity"] == [{"Account": "123"}]
+
+
+def test_patch_data_callable_response():
+    """Should call the callable response objects given in the patch data."""
+    response = MagicMock(return_value={"Account": "123"})
+    data = {"clients": {"sts": {"get_caller_identity": [response, response]}}}
+
+    @lobotomy.Patch(data=data)
+    def get_account(lobotomized: lobotomy.Lobotomy) -> str:
+        return lobotomized().client("sts").get_caller_identity()["Account"]
+
+    assert get_account() == "123"
+    assert get_account() == "123"
+    assert response.call_count == 2
+    assert data["clients"]["sts"]["get_caller_identity"] == [response, response]
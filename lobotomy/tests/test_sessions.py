@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 
 import lobotomy
+from lobotomy import _services
 
 
 def test_creation_empty():
@@ -87,6 +90,19 @@ def test_credentials(lob: lobotomy.Lobotomy):
     assert frozen.access_key == "A123"
     assert frozen.secret_key == "123abc"
     assert frozen.token == "foobar"
+    assert observed.get_frozen_credentials() is frozen
+
+
+def test_session_data_per_session():
+    """Should use the next session data in the list for each new session."""
+    lob = lobotomy.Lobotomy(
+        data={"sessions": [{"region_name": "us-east-1"}, {"region_name": "eu-west-1"}]}
+    )
+    assert lob().region_name == "us-east-1"
+    assert lob().region_name == "eu-west-1"
+
+    lob.data = {"session": {"region_name": "us-west-2"}}
+    assert lob().region_name == "us-west-2"
 
 
 @lobotomy.Patch(client_overrides={"sts": {"foo": "bar"}})
@@ -109,3 +125,166 @@ def test_override_removed(lob: lobotomy.Lobotomy):
     session = lob.remove_client_override("sts")()
     assert session.client("sts") != {"foo": "bar"}
     assert isinstance(session.client("sts"), lobotomy.Client)
+
+
+def test_override_after_session_creation():
+    """Should apply overrides changed after the session was created."""
+    lob = lobotomy.Lobotomy()
+    session = lob()
+    client = session.client("sts")
+    assert session.client("sts") is client
+
+    lob.add_client_override("sts", {"foo": "bar"})
+    assert session.client("sts") == {"foo": "bar"}
+
+    lob.remove_client_override("sts")
+    assert session.client("sts") is client
+
+
+def test_client_service_definitions():
+    """Should share loaded service definitions among clients of the same service."""
+    lob = lobotomy.Lobotomy()
+    first = lob().client("sts")
+    second = lob().client("sts")
+    assert first is not second
+    assert first._service is second._service
+
+
+def test_service_specifications():
+    """Should share loaded specifications among service definitions."""
+    first = _services.Service("sts")
+    second = _services.Service("sts")
+    assert first.data is not second.data
+    assert first.operations is second.operations
+    assert first.exceptions == second.exceptions
+
+
+def test_service_method_definitions():
+    """Should parse the method input and output definitions only once."""
+    method = _services.load_definition("s3").lookup("list_objects_v2")
+    assert method.input is method.input
+    assert method.output is method.output
+    assert method.configuration_output is not method.configuration_output
+
+
+def test_client_method_reuse():
+    """Should reuse the same method caller for repeated method accesses."""
+    lob = lobotomy.Lobotomy()
+    lob.add_call("sts", "get_caller_identity", {"Account": "123"})
+    lob.add_call("sts", "get_caller_identity", {"Account": "456"})
+    client = lob().client("sts")
+    assert client.get_caller_identity is client.get_caller_identity
+    assert client.get_caller_identity()["Account"] == "123"
+    assert client.get_caller_identity()["Account"] == "456"
+
+
+def test_client_meta():
+    """Should create the client metadata on first access and reuse it."""
+    lob = lobotomy.Lobotomy()
+    client = lob().client("sts", endpoint_url="http://localhost:4566")
+    assert "meta" not in vars(client)
+    assert client.meta.endpoint_url == "http://localhost:4566"
+    assert client.meta is client.meta
+
+
+def test_client_method_lookup():
+    """Should find and cache method definitions in a single lookup."""
+    service = lobotomy.Lobotomy()().client("sts")._service
+    method = service.find("get_caller_identity")
+    assert method is not None
+    assert service.find("get_caller_identity") is method
+    assert service.lookup("get_caller_identity") is method
+    assert service.find("fake_method") is None
+    assert not service.has("fake_method")
+    assert service.lookup("fake_method").data == {}
+
+
+def test_client_private_attributes():
+    """Should raise attribute errors for missing underscore attributes."""
+    client = lobotomy.Lobotomy()().client("sts")
+    assert not hasattr(client, "__wrapped__")
+    assert not hasattr(client, "_get_caller_identity")
+    with pytest.raises(lobotomy.NoSuchMethod):
+        client.fake_method()
+
+
+def test_client_calls():
+    """Should derive the client calls from the calls recorded by lobotomy."""
+    lob = lobotomy.Lobotomy()
+    lob.add_call("sts", "get_caller_identity", {"Account": "123"})
+    lob.add_call("s3", "list_objects_v2", {"Contents": []})
+    session = lob()
+    client = session.client("sts")
+    client.get_caller_identity()
+    session.client("s3").list_objects_v2(Bucket="my-bucket")
+    assert [c.method for c in client._calls] == ["get_caller_identity"]
+    assert len(lob.service_calls) == 2
+
+
+def test_add_call_responses():
+    """Should accumulate added responses for a method in a side effect list."""
+    lob = lobotomy.Lobotomy()
+    for account in ("1", "2", "3"):
+        lob.add_call("sts", "get_caller_identity", {"Account": account})
+    responses = lob.data["clients"]["sts"]["get_caller_identity"]
+    assert [r["Account"] for r in responses] == ["1", "2", "3"]
+
+
+def test_get_service_calls_by_method():
+    """Should only retrieve the service calls made for the given method."""
+    lob = lobotomy.Lobotomy()
+    lob.add_call("sts", "get_caller_identity", {"Account": "123"})
+    lob.add_call("s3", "list_objects_v2", [{"Contents": []}, {"Contents": []}])
+    session = lob()
+    session.client("s3").list_objects_v2(Bucket="first")
+    session.client("sts").get_caller_identity()
+    session.client("s3").list_objects_v2(Bucket="second")
+
+    calls = lob.get_service_calls("s3", "list_objects_v2")
+    assert [c.request["Bucket"] for c in calls] == ["first", "second"]
+    assert lob.get_service_call("s3", "list_objects_v2", 1).request["Bucket"] == (
+        "second"
+    )
+    assert lob.get_service_calls("s3", "get_object") == []
+    assert [c.service for c in lob.service_calls] == ["s3", "sts", "s3"]
+
+
+def test_service_call_record():
+    """Should record service calls with their normalized requests and responses."""
+    lob = lobotomy.Lobotomy()
+    lob.add_call("s3", "list_objects_v2", {"Contents": []})
+    lob().client("s3").list_objects_v2("my-bucket", Prefix="foo/")
+
+    call = lob.get_service_call("s3", "list_objects_v2")
+    assert isinstance(call, lobotomy.ServiceCall)
+    assert call.request == {"Bucket": "my-bucket", "Prefix": "foo/"}
+    assert call.args == ("my-bucket",)
+    assert call.kwargs == {"Prefix": "foo/"}
+    assert call.response["Contents"] == []
+    assert call == lobotomy.ServiceCall(*call)
+    with pytest.raises(AttributeError):
+        call.response = None  # type: ignore
+
+
+def test_session_events():
+    """Should create the mocked session events on first access only."""
+    session = lobotomy.Lobotomy()()
+    events = session.events
+    assert session.events is events
+    events.register("before-call", print)
+    events.register.assert_called_once()
+
+    session.events = None  # type: ignore
+    assert session.events is not events
+
+
+def test_session_patched_attributes():
+    """Should allow patching and setting attributes on sessions like boto3 ones."""
+    session = lobotomy.Lobotomy()()
+    with patch.object(session, "client", return_value="patched") as client:
+        assert session.client("s3") == "patched"
+    client.assert_called_once_with("s3")
+    assert isinstance(session.client("s3"), lobotomy.Client)
+
+    session.custom = "foo"  # type: ignore
+    assert session.custom == "foo"  # type: ignore
@@ -0,0 +1,12 @@
+import pathlib
+
+import toml
+
+import lobotomy
+
+
+def test_version():
+    """Should match the version specified in the pyproject.toml file."""
+    path = pathlib.Path(lobotomy.__file__).parent.parent.joinpath("pyproject.toml")
+    expected = toml.loads(path.read_text())["tool"]["poetry"]["version"]
+    assert lobotomy.__version__ == expected